@@ -1,7 +1,9 @@
 # Draft Autosave for Add Cards Window
 # -----------------------------------
 # Features:
-# - Autosaves Add dialog fields + tags every AUTOSAVE_INTERVAL_MS
+# - Autosaves Add dialog fields + tags AUTOSAVE_DEBOUNCE_MS after each edit,
+#   plus a fallback save every AUTOSAVE_INTERVAL_MS
+#   (backing off to MAX_AUTOSAVE_INTERVAL_MS while nothing changes)
 # - Keeps separate drafts per note type
 # - Stores a timestamp for each draft
 # - Ignores/cleans drafts older than MAX_AGE_SECONDS
@@ -14,33 +16,156 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from aqt import mw
 from aqt.addcards import AddCards
-from aqt.gui_hooks import add_cards_did_init, add_cards_did_add_note
-from aqt.qt import QTimer, QCloseEvent
+from aqt.gui_hooks import (
+    add_cards_did_init,
+    add_cards_did_add_note,
+    profile_did_open,
+    editor_did_fire_typing_timer,
+    editor_did_unfocus_field,
+    editor_did_update_tags,
+)
+from aqt.qt import QTimer, QCloseEvent, QRunnable, QThreadPool
+
+try:
+    import orjson  # bundled with recent Anki; much faster than stdlib json
+except ImportError:
+    orjson = None
+
+# Stdlib fallbacks, built once instead of on every json.dumps/json.loads
+# call; compact separators match orjson's output.
+_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_DECODE = json.JSONDecoder().decode
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 # ---- Configuration --------------------------------------------------------
 
-# How often to autosave (milliseconds)
-AUTOSAVE_INTERVAL_MS = 5000  # 5000 = 5 seconds
+# How long after the last edit to autosave (milliseconds)
+AUTOSAVE_DEBOUNCE_MS = 1500  # 1500 = 1.5 seconds
+
+# Fallback autosave interval, in case an edit didn't fire an editor hook
+# (milliseconds)
+AUTOSAVE_INTERVAL_MS = 30000  # 30000 = 30 seconds
+
+# While nothing changes, the interval doubles after each tick up to this cap
+MAX_AUTOSAVE_INTERVAL_MS = 60000  # 60000 = 60 seconds
 
 # How long drafts are considered "fresh" (seconds)
 # Example: 48 hours = 48 * 60 * 60
 MAX_AGE_SECONDS = 48 * 60 * 60
 
+# Minimum time between prunes of stale drafts (seconds)
+PRUNE_INTERVAL_SECONDS = 60 * 60
+
+# Buffer size for writing a backup file (bytes)
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+# Extension of base draft files: zstd-compressed JSON when the zstandard
+# module is available, plain JSON otherwise
+_BASE_EXT = ".json.zst" if zstandard is not None else ".json"
+
+# zstd level 1 is fast and still shrinks HTML / base64 images several-fold
+_zstd_compressor = zstandard.ZstdCompressor(level=1) if zstandard is not None else None
+
+
+# ---- In-memory cache of the backup files ---------------------------------
+
+# Decoded backup entries keyed by file path, as (mtime, entry, encoded
+# size). A file is re-read only when its mtime no longer matches. The size
+# is of the uncompressed encoding, which is what delta logs are measured
+# against.
+_cache: Dict[str, Tuple[float, Dict[str, Any], int]] = {}
+
+# When stale drafts were last pruned; 0 means not yet this session.
+_last_prune_ts = 0.0
+
+
+# ---- Background saving state ---------------------------------------------
+
+# Add dialogs with autosave running, so editor hooks can find their dialog.
+_autosave_dialogs: List[AddCards] = []
+
+# Guards the cache and the backup files; saves run on a worker thread.
+_lock = threading.RLock()
+
+# Guards the save queue below. Kept separate from _lock (which is held for
+# the whole disk write) so autosave ticks never wait on a running save.
+# Clears also run on the thread pool. Restoring a draft when the Add dialog
+# opens, and the prune when a profile opens, still take _lock on the GUI
+# thread and can briefly wait for a save in progress.
+_queue_lock = threading.Lock()
+
+# Set while a _SaveRunnable is running; new snapshots wait in _pending.
+_saving = threading.Event()
+# Snapshot queued for saving: (backup dir, note type, fields, tags,
+# clear generation). The directory is resolved on the GUI thread when the
+# snapshot is taken, so a save never calls into ProfileManager from a worker
+# or lands in a profile that was opened after the edit.
+_Snapshot = Tuple[str, str, List[str], List[str], int]
+_pending: Optional[_Snapshot] = None
+
+# Bumped whenever drafts are cleared, so saves queued earlier are dropped
+# instead of bringing the draft back.
+_generation = 0
+
 
 # ---- Helpers: paths & basic utilities ------------------------------------
 
-def _backup_path() -> str:
-    """Path for the autosave file (per profile)."""
+def _backup_dir() -> str:
+    """Directory holding one autosave file per note type (per profile)."""
     profile_dir = mw.pm.profileFolder()
-    return os.path.join(profile_dir, "add_cards_autosave.json")
+    return os.path.join(profile_dir, "add_cards_autosave")
+
+
+def _nt_path(nt_name: str, ext: str = _BASE_EXT, backup_dir: Optional[str] = None) -> str:
+    """Autosave file for a note type; the name is hashed to be filename-safe.
+
+    ".json.zst" / ".json" holds the full base draft, ".jsonl" the deltas
+    appended since. Despite the extensions, neither is a JSON document: both
+    hold tab-separated lines (see _encode_entry / _encode_delta) whose
+    columns are JSON-encoded; the names are kept so files from earlier
+    versions, which were JSON, are still found. backup_dir defaults to the
+    current profile's _backup_dir().
+    """
+    if backup_dir is None:
+        backup_dir = _backup_dir()
+    digest = hashlib.sha1(nt_name.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(backup_dir, digest + ext)
+
+
+def _existing_base_path(nt_name: str, backup_dir: Optional[str] = None) -> str:
+    """Base draft file to read for a note type.
+
+    Falls back to a plain ".json" base written before zstandard was
+    available; new bases are always written to _nt_path(nt_name).
+    """
+    path = _nt_path(nt_name, backup_dir=backup_dir)
+    if _BASE_EXT != ".json" and not os.path.exists(path):
+        plain = _nt_path(nt_name, ".json", backup_dir)
+        if os.path.exists(plain):
+            return plain
+    return path
+
+
+def _legacy_backup_path(backup_dir: Optional[str] = None) -> str:
+    """Path of the old single autosave file, only read for migration."""
+    if backup_dir is None:
+        backup_dir = _backup_dir()
+    return os.path.join(os.path.dirname(backup_dir), "add_cards_autosave.json")
 
 
 def _now_ts() -> float:
@@ -48,6 +173,22 @@ def _now_ts() -> float:
     return time.time()
 
 
+def _file_size(path: str) -> Optional[int]:
+    """Size of path in bytes, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    """Modification time of path, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
 # ---- Helpers: note & fields ----------------------------------------------
 
 def _note_type_name(note) -> str:
@@ -63,75 +204,316 @@ def _note_type_name(note) -> str:
 
 def _extract_fields(note) -> List[str]:
     """Return the list of field values in order."""
-    fields: List[str] = []
-    for _, value in note.items():
-        fields.append(value)
-    return fields
+    return [value for _, value in note.items()]
 
 
 def _apply_fields(note, fields: List[str]) -> None:
     """Set field contents back onto a note."""
-    for i, (field_name, _old_val) in enumerate(note.items()):
-        if i < len(fields):
-            note[field_name] = fields[i]
+    # zip() stops at the shorter side, so extra or missing saved fields
+    # (e.g. after the note type was edited) are ignored.
+    for field_name, value in zip(note.keys(), fields):
+        note[field_name] = value
+
+
+# ---- Helpers: JSON read/write (one file per notetype) --------------------
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _ENCODE(data).encode("utf-8")
 
 
-# ---- Helpers: JSON read/write (multi-notetype) ---------------------------
+def _loads(raw: bytes) -> Any:
+    """Decode UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return _DECODE(raw.decode("utf-8"))
 
-def _load_all_backups() -> Dict[str, Any]:
+
+def _encode_entry(entry: Dict[str, Any]) -> bytes:
+    """Encode a base draft as one tab-separated line.
+
+    Format: last_saved <TAB> json(name) <TAB> json(fields) <TAB> json(tags)
+    JSON escapes tabs and newlines inside strings, so the separators are
+    unambiguous, and the key names aren't repeated in every file.
+    """
+    return b"\t".join([
+        repr(float(entry.get("last_saved", 0))).encode("ascii"),
+        _dumps(entry.get("name", "")),
+        _dumps(entry.get("fields", [])),
+        _dumps(entry.get("tags", [])),
+    ]) + b"\n"
+
+
+def _decode_entry(raw: bytes) -> Any:
+    """Decode a base draft written by _encode_entry (or as a JSON object)."""
+    if raw[:1] == b"{":
+        # Written by an older version as a JSON object
+        return _loads(raw)
+    last_saved, name, fields, tags = raw.rstrip(b"\n").split(b"\t")
+    return {
+        "name": _loads(name),
+        "last_saved": float(last_saved),
+        "fields": _loads(fields),
+        "tags": _loads(tags),
+    }
+
+
+def _encode_delta(record: Dict[str, Any]) -> bytes:
+    """Encode a delta record as one tab-separated line.
+
+    Format: base <TAB> ts <TAB> json(delta) <TAB> json(tags)
     """
-    Load the full backup mapping from disk.
+    return b"\t".join([
+        repr(float(record["base"])).encode("ascii"),
+        repr(float(record["ts"])).encode("ascii"),
+        _dumps(record["delta"]),
+        _dumps(record["tags"]),
+    ]) + b"\n"
+
+
+def _decode_delta(line: bytes) -> Dict[str, Any]:
+    """Decode a delta line written by _encode_delta (or as a JSON object)."""
+    if line[:1] == b"{":
+        # Written by an older version as a JSON object
+        return _loads(line)
+    base, ts, delta, tags = line.split(b"\t")
+    return {
+        "base": float(base),
+        "ts": float(ts),
+        "delta": _loads(delta),
+        "tags": _loads(tags),
+    }
+
 
-    Structure:
+def _remove_file(path: str) -> None:
+    """Delete a backup file (and its cache entry), ignoring errors."""
+    _cache.pop(path, None)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass
+
+
+def _read_entry(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load one note type's backup entry from disk.
+
+    On disk it is one _encode_entry line; once decoded:
     {
-      "Basic": {
-          "last_saved": 1710000000.0,
-          "fields": [...],
-          "tags": [...]
-      },
-      "Cloze": {
-          ...
-      }
+      "name": "Basic",
+      "last_saved": 1710000000.0,
+      "fields": [...],
+      "tags": [...]
     }
     """
-    path = _backup_path()
-    if not os.path.exists(path):
-        return {}
+    mtime = _file_mtime(path)
+    if mtime is None:
+        _cache.pop(path, None)
+        return None
+
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, dict):
-            return data
-        return {}
+        with open(path, "rb") as f:
+            raw = f.read()
+        if path.endswith(".zst"):
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        entry = _decode_entry(raw)
     except Exception:
-        # If file is corrupted, just ignore it.
-        return {}
+        # If file is corrupted (or zstandard went missing), just ignore it.
+        _cache.pop(path, None)
+        return None
 
+    if not isinstance(entry, dict):
+        return None
+    _cache[path] = (mtime, entry, len(raw))
+    return entry
 
-def _save_all_backups(data: Dict[str, Any]) -> None:
-    """Write the full backup mapping to disk."""
-    path = _backup_path()
+
+def _write_entry(path: str, entry: Dict[str, Any]) -> bool:
+    """Write one note type's backup entry to disk.
+
+    Writes to a temp file first and swaps it in with os.replace, so a crash
+    mid-write never leaves a truncated backup behind. Returns False if the
+    write failed.
+    """
+    tmp = path + ".tmp"
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Serialize up front so the file gets a single write() call.
+        raw = _encode_entry(entry)
+        size = len(raw)
+        if path.endswith(".zst"):
+            raw = _zstd_compressor.compress(raw)
+        with open(tmp, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
     except Exception:
         # Fail silently – losing the backup is better than crashing Anki.
-        pass
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+        _cache.pop(path, None)
+        return False
+
+    mtime = _file_mtime(path)
+    if mtime is not None:
+        _cache[path] = (mtime, entry, size)
+    return True
+
+
+def _append_delta(log_path: str, line: bytes) -> bool:
+    """Append one encoded delta line to a draft's log.
+
+    Returns False if the append failed.
+    """
+    try:
+        with open(log_path, "ab", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        return True
+    except Exception:
+        return False
 
 
-def _prune_old_backups(backups: Dict[str, Any]) -> Dict[str, Any]:
-    """Remove entries older than MAX_AGE_SECONDS."""
+def _apply_latest_delta(base: Dict[str, Any], log_path: str) -> Dict[str, Any]:
+    """Return the base draft with the newest delta from its log applied.
+
+    Each delta holds every field that differs from the base, so only the last
+    well-formed record for this base matters. Deltas written against an
+    older base, or a line torn by a crash mid-append, are skipped.
+    """
+    try:
+        with open(log_path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return base
+
+    if raw and not raw.endswith(b"\n"):
+        # Terminate a torn last line so later appends start on a new line.
+        try:
+            with open(log_path, "ab") as f:
+                f.write(b"\n")
+        except Exception:
+            pass
+
+    lines = raw.splitlines()
+
+    for line in reversed(lines):
+        try:
+            record = _decode_delta(line)
+            if record.get("base") != base.get("last_saved"):
+                continue
+            fields = list(base.get("fields") or [])
+            for idx, value in record["delta"].items():
+                i = int(idx)
+                if 0 <= i < len(fields):
+                    fields[i] = value
+        except Exception:
+            continue
+        return dict(
+            base,
+            fields=fields,
+            tags=record.get("tags", base.get("tags")),
+            last_saved=record.get("ts", base.get("last_saved")),
+        )
+    return base
+
+
+def _migrate_legacy_backups() -> None:
+    """Split the old add_cards_autosave.json into per-notetype files.
+
+    The old file mapped note type names to entries. Fresh entries are copied
+    to their own file (keeping their timestamp as the file mtime, so pruning
+    still sees their real age). The old file is only removed once every
+    fresh entry has been copied; otherwise it is kept so the next load
+    retries, since it may be the only copy of those drafts.
+    """
+    path = _legacy_backup_path()
+    if not os.path.exists(path):
+        return
+
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        # Can't read it right now; try again next time.
+        return
+    try:
+        backups = _loads(raw)
+    except Exception:
+        backups = {}
+    if not isinstance(backups, dict):
+        backups = {}
+
+    migrated = True
     now = _now_ts()
-    cleaned: Dict[str, Any] = {}
     for nt_name, entry in backups.items():
         try:
             last_saved = float(entry.get("last_saved", 0))
         except Exception:
             continue
-        if now - last_saved <= MAX_AGE_SECONDS:
-            cleaned[nt_name] = entry
-    return cleaned
+        if now - last_saved > MAX_AGE_SECONDS:
+            continue
+
+        nt_path = _nt_path(nt_name)
+        if os.path.exists(nt_path):
+            continue
+        if not _write_entry(nt_path, dict(entry, name=nt_name)):
+            migrated = False
+            continue
+        try:
+            os.utime(nt_path, (last_saved, last_saved))
+        except Exception:
+            pass
+        _cache.pop(nt_path, None)
+
+    if migrated:
+        _remove_file(path)
+
+
+def _prune_old_backups(backup_dir: Optional[str] = None) -> None:
+    """Delete drafts whose files were not written within MAX_AGE_SECONDS.
+
+    A base file and its delta log count as one draft, aged by the newer one.
+    """
+    global _last_prune_ts
+    _last_prune_ts = _now_ts()
+    if backup_dir is None:
+        backup_dir = _backup_dir()
+    try:
+        names = os.listdir(backup_dir)
+    except OSError:
+        return
+
+    # Usually nothing is stale, so only old files are collected (no
+    # per-file bookkeeping for fresh ones) and the second pass is empty.
+    cutoff = _now_ts() - MAX_AGE_SECONDS
+    fresh_stems = set()
+    stale: List[Tuple[str, str]] = []
+    for name in names:
+        stem = name.split(".", 1)[0]
+        mtime = _file_mtime(os.path.join(backup_dir, name))
+        if mtime is None:
+            continue
+        if mtime < cutoff:
+            stale.append((stem, name))
+        else:
+            fresh_stems.add(stem)
+
+    for stem, name in stale:
+        if stem not in fresh_stems:
+            _remove_file(os.path.join(backup_dir, name))
 
 
 def _load_backup_for_notetype(nt_name: str) -> Optional[Dict[str, Any]]:
@@ -139,76 +521,207 @@ def _load_backup_for_notetype(nt_name: str) -> Optional[Dict[str, Any]]:
     if not nt_name:
         return None
 
-    backups = _load_all_backups()
-    backups = _prune_old_backups(backups)
-
-    # Clean up old entries on disk immediately
-    _save_all_backups(backups)
+    with _lock:
+        _migrate_legacy_backups()
+
+        path = _existing_base_path(nt_name)
+        log_path = _nt_path(nt_name, ".jsonl")
+        mtime = _file_mtime(path)
+        if mtime is None:
+            return None
+        mtime = max(mtime, _file_mtime(log_path) or 0)
+        if mtime < _now_ts() - MAX_AGE_SECONDS:
+            # Not written recently enough to hold a fresh draft; clean it
+            _remove_file(path)
+            _remove_file(log_path)
+            return None
+
+        entry = _read_entry(path)
+        if not entry:
+            return None
+        entry = _apply_latest_delta(entry, log_path)
 
-    entry = backups.get(nt_name)
-    if not entry:
-        return None
+        try:
+            last_saved = float(entry.get("last_saved", 0))
+        except Exception:
+            return None
 
-    try:
-        last_saved = float(entry.get("last_saved", 0))
-    except Exception:
-        return None
+        if _now_ts() - last_saved > MAX_AGE_SECONDS:
+            # Too old; ignore and clean
+            _remove_file(path)
+            _remove_file(log_path)
+            return None
 
-    if _now_ts() - last_saved > MAX_AGE_SECONDS:
-        # Too old; ignore and clean
-        backups.pop(nt_name, None)
-        _save_all_backups(backups)
-        return None
+        return entry
 
-    return entry
 
+def _save_backup_for_notetype(
+    nt_name: str, fields: List[str], tags: List[str], backup_dir: Optional[str] = None
+) -> None:
+    """Save a backup entry for a specific note type (touches only its files).
 
-def _save_backup_for_notetype(nt_name: str, fields: List[str], tags: List[str]) -> None:
-    """Save a backup entry for a specific note type."""
+    Normally only the fields that differ from the base draft are appended to
+    the delta log. The full draft is rewritten as a new base when there is no
+    usable base or the log has grown bigger than the base.
+    """
+    if not nt_name:
+        return
+    if backup_dir is None:
+        backup_dir = _backup_dir()
+
+    with _lock:
+        # Stale drafts are rare; amortize the directory scan.
+        if _now_ts() - _last_prune_ts > PRUNE_INTERVAL_SECONDS:
+            _prune_old_backups(backup_dir)
+
+        path = _existing_base_path(nt_name, backup_dir)
+        log_path = _nt_path(nt_name, ".jsonl", backup_dir)
+        now = _now_ts()
+
+        base = _read_entry(path)
+        base_fields = base.get("fields") if base else None
+        if isinstance(base_fields, list) and len(base_fields) == len(fields):
+            delta = {
+                str(i): value
+                for i, (value, old) in enumerate(zip(fields, base_fields))
+                if value != old
+            }
+            line = _encode_delta({
+                "base": base.get("last_saved"),
+                "ts": now,
+                "delta": delta,
+                "tags": tags,
+            })
+            # Decide before writing: if this line would push the log past
+            # the base, rebase instead of appending a line that is
+            # discarded right after. The base is compared uncompressed (as
+            # cached by _read_entry), like the log; its zstd size on disk
+            # would force a rebase on nearly every save of a large draft.
+            log_size = (_file_size(log_path) or 0) + len(line)
+            cached = _cache.get(path)
+            base_size = cached[2] if cached is not None else 0
+            if log_size <= base_size and _append_delta(log_path, line):
+                return
+
+        # Write a fresh base; deltas for the old base are now ignored.
+        new_path = _nt_path(nt_name, backup_dir=backup_dir)
+        if _write_entry(new_path, {
+            "name": nt_name,
+            "last_saved": now,
+            "fields": fields,
+            "tags": tags,
+        }):
+            _remove_file(log_path)
+            if path != new_path:
+                _remove_file(path)
+
+
+def _drop_queued_saves() -> None:
+    """Make saves snapshotted so far no-ops (call before clearing drafts)."""
+    global _generation, _pending
+    with _queue_lock:
+        _generation += 1
+        _pending = None
+
+
+def _clear_backup_for_notetype(nt_name: str, backup_dir: Optional[str] = None) -> None:
+    """Remove backup for a specific note type."""
     if not nt_name:
         return
+    if backup_dir is None:
+        backup_dir = _backup_dir()
+    # Drop any autosave still queued from before the clear.
+    _drop_queued_saves()
+    with _lock:
+        for ext in (".json.zst", ".json", ".jsonl"):
+            _remove_file(_nt_path(nt_name, ext, backup_dir))
 
-    backups = _load_all_backups()
-    backups = _prune_old_backups(backups)
 
-    backups[nt_name] = {
-        "last_saved": _now_ts(),
-        "fields": fields,
-        "tags": tags,
-    }
+def _clear_all_backups(backup_dir: Optional[str] = None) -> None:
+    """Remove all backups."""
+    if backup_dir is None:
+        backup_dir = _backup_dir()
+    _drop_queued_saves()
+    with _lock:
+        try:
+            names = os.listdir(backup_dir)
+        except OSError:
+            names = []
+        for name in names:
+            _remove_file(os.path.join(backup_dir, name))
+        _remove_file(_legacy_backup_path(backup_dir))
 
-    _save_all_backups(backups)
 
+# ---- Background saving ---------------------------------------------------
 
-def _clear_backup_for_notetype(nt_name: str) -> None:
-    """Remove backup for a specific note type; delete file if empty."""
-    if not nt_name:
-        return
-    backups = _load_all_backups()
-    if nt_name in backups:
-        backups.pop(nt_name, None)
-        if backups:
-            _save_all_backups(backups)
-        else:
-            # No backups left; remove file
-            path = _backup_path()
+class _SaveRunnable(QRunnable):
+    """Writes autosave snapshots off the GUI thread, latest snapshot last."""
+
+    def __init__(self, snapshot: _Snapshot) -> None:
+        super().__init__()
+        self.snapshot: Optional[_Snapshot] = snapshot
+
+    def run(self) -> None:
+        global _pending
+        snapshot = self.snapshot
+        while snapshot is not None:
+            backup_dir, nt_name, fields, tags, generation = snapshot
             try:
-                os.remove(path)
-            except FileNotFoundError:
-                pass
+                with _lock:
+                    if generation == _generation:
+                        _save_backup_for_notetype(nt_name, fields, tags, backup_dir)
             except Exception:
+                # Never let a failed save take down the worker thread.
                 pass
 
+            # Pick up whatever was queued while we were writing.
+            with _queue_lock:
+                snapshot = _pending
+                _pending = None
+                if snapshot is None:
+                    _saving.clear()
+
+
+class _ClearRunnable(QRunnable):
+    """Clears a note type's draft (or all drafts) off the GUI thread."""
+
+    def __init__(self, nt_name: str, backup_dir: str) -> None:
+        super().__init__()
+        self.nt_name = nt_name
+        self.backup_dir = backup_dir
+
+    def run(self) -> None:
+        try:
+            if self.nt_name:
+                _clear_backup_for_notetype(self.nt_name, self.backup_dir)
+            else:
+                # As a fallback, clear all drafts
+                _clear_all_backups(self.backup_dir)
+        except Exception:
+            # Don't let errors here crash Anki
+            pass
+
+
+def _queue_backup_save(backup_dir: str, nt_name: str, fields: List[str], tags: List[str]) -> None:
+    """Save a backup on the thread pool; coalesces saves while one is running."""
+    global _pending
+    with _queue_lock:
+        snapshot = (backup_dir, nt_name, fields, tags, _generation)
+        if _saving.is_set():
+            # Only the latest snapshot matters; the running save picks it up
+            # when it finishes, so the pool never queues stale work.
+            _pending = snapshot
+            return
+        _saving.set()
 
-def _clear_all_backups() -> None:
-    """Remove all backups."""
-    path = _backup_path()
     try:
-        os.remove(path)
-    except FileNotFoundError:
-        pass
+        QThreadPool.globalInstance().start(_SaveRunnable(snapshot))
     except Exception:
-        pass
+        # Nothing is running, so don't leave _saving set: that would park
+        # every later snapshot in _pending and silently stop autosave.
+        with _queue_lock:
+            _saving.clear()
+            _pending = None
 
 
 # ---- Core logic: restore + autosave --------------------------------------
@@ -237,7 +750,9 @@ def _restore_into_add_dialog(add_cards: AddCards) -> None:
     _apply_fields(note, fields)
     if isinstance(tags, list):
         try:
-            note.tags = tags
+            # Copy: the entry is shared with the backup cache, which the
+            # save worker thread reads.
+            note.tags = list(tags)
         except Exception:
             pass
 
@@ -252,19 +767,44 @@ def _restore_into_add_dialog(add_cards: AddCards) -> None:
 
 
 def _start_autosave_timer(add_cards: AddCards) -> None:
-    """Start a QTimer attached to the Add dialog that periodically saves the note."""
+    """Set up autosave for the Add dialog.
+
+    Edits (reported via editor hooks) restart a single-shot debounce timer;
+    a slow interval timer acts as a fallback.
+    """
     editor = add_cards.editor
 
     # Track the last note type name we autosaved for this dialog,
-    # so that when the dialog is closed, we know what to clear.
-    add_cards._draft_autosave_last_nt_name = ""  # type: ignore[attr-defined]
-
-    def do_autosave() -> None:
+    # so that when the dialog is closed, we know what to clear. Seeded from
+    # the note being edited: the first save may be up to
+    # AUTOSAVE_INTERVAL_MS away, and closing before it must not fall back
+    # to clearing every note type's draft.
+    add_cards._draft_autosave_last_nt_name = _note_type_name(editor.note)  # type: ignore[attr-defined]
+
+    # Hash of the last (clear generation, note type, fields, tags) written
+    # for this dialog, so unchanged ticks don't rewrite the backup file.
+    # Reset by _forget_saved_payloads when a draft is cleared; the generation
+    # also changes once a clear has run on the thread pool, so the draft is
+    # written again if the dialog stays open (e.g. "Discard?" answered No).
+    add_cards._draft_autosave_last_payload = None  # type: ignore[attr-defined]
+
+    # (note type id, name) of the note last seen, so the name is only looked
+    # up again when the note type changes.
+    add_cards._draft_nt_name_cached = (None, "")  # type: ignore[attr-defined]
+
+    def do_autosave(fallback_tick: bool = False) -> None:
+        if getattr(add_cards, "_close_event_has_cleaned_up", False):
+            # Window really closed (newer Anki); don't bring the draft back.
+            return
         note = editor.note
         if note is None:
             return
 
-        nt_name = _note_type_name(note)
+        mid = getattr(note, "mid", None)
+        cached_mid, nt_name = add_cards._draft_nt_name_cached  # type: ignore[attr-defined]
+        if mid is None or mid != cached_mid:
+            nt_name = _note_type_name(note)
+            add_cards._draft_nt_name_cached = (mid, nt_name)  # type: ignore[attr-defined]
         if not nt_name:
             return
 
@@ -272,18 +812,82 @@ def _start_autosave_timer(add_cards: AddCards) -> None:
         add_cards._draft_autosave_last_nt_name = nt_name  # type: ignore[attr-defined]
 
         fields = _extract_fields(note)
-        tags = list(getattr(note, "tags", []))
+        # One tuple copy serves both the change check and the snapshot;
+        # a list is only built when there is something to save.
+        tags = tuple(getattr(note, "tags", ()))
+
+        payload = hash((_generation, nt_name, tuple(fields), tags))
+        if payload == add_cards._draft_autosave_last_payload:  # type: ignore[attr-defined]
+            # Idle: back off so an untouched dialog is checked less often.
+            # Only on the fallback timer's own ticks, since setInterval
+            # restarts its countdown.
+            if fallback_tick:
+                timer.setInterval(min(MAX_AUTOSAVE_INTERVAL_MS, timer.interval() * 2))
+            return
+        add_cards._draft_autosave_last_payload = payload  # type: ignore[attr-defined]
 
-        _save_backup_for_notetype(nt_name, fields, tags)
+        # Editing again: go back to the normal interval.
+        if timer.interval() != AUTOSAVE_INTERVAL_MS:
+            timer.setInterval(AUTOSAVE_INTERVAL_MS)
+
+        # Only the snapshot is taken here; encoding and writing happen
+        # on a worker thread.
+        _queue_backup_save(_backup_dir(), nt_name, fields, list(tags))
+
+    debounce = QTimer(add_cards)
+    debounce.setSingleShot(True)
+    debounce.setInterval(AUTOSAVE_DEBOUNCE_MS)
+    debounce.timeout.connect(do_autosave)
 
     timer = QTimer(add_cards)
     timer.setInterval(AUTOSAVE_INTERVAL_MS)
-    timer.timeout.connect(do_autosave)
+    timer.timeout.connect(lambda: do_autosave(fallback_tick=True))
     timer.start()
 
-    # Keep a reference so it stays alive with the dialog
+    # Keep references so they stay alive with the dialog
+    add_cards._draft_autosave_debounce = debounce  # type: ignore[attr-defined]
     add_cards._draft_autosave_timer = timer  # type: ignore[attr-defined]
 
+    _autosave_dialogs.append(add_cards)
+
+    def forget_dialog() -> None:
+        try:
+            _autosave_dialogs.remove(add_cards)
+        except ValueError:
+            pass
+
+    add_cards.destroyed.connect(forget_dialog)
+
+
+def _forget_saved_payloads() -> None:
+    """Make every open Add dialog save again shortly.
+
+    Called whenever a draft is cleared, so that a dialog which is still
+    open rewrites its draft even if the note itself hasn't changed. The
+    debounce timer is started too, so this happens AUTOSAVE_DEBOUNCE_MS
+    later rather than on a fallback tick that may be a minute away.
+    """
+    for add_cards in list(_autosave_dialogs):
+        try:
+            add_cards._draft_autosave_last_payload = None  # type: ignore[attr-defined]
+            add_cards._draft_autosave_debounce.start()  # type: ignore[attr-defined]
+        except Exception:
+            # Dialog is being torn down; it will be forgotten shortly.
+            pass
+
+
+def _schedule_autosave(note) -> None:
+    """(Re)start the debounce timer of the Add dialog editing this note."""
+    if note is None:
+        return
+    for add_cards in list(_autosave_dialogs):
+        try:
+            if add_cards.editor.note is note:
+                add_cards._draft_autosave_debounce.start()  # type: ignore[attr-defined]
+        except Exception:
+            # Dialog is being torn down; it will be forgotten shortly.
+            pass
+
 
 # ---- Patch AddCards.closeEvent to clear draft on real close --------------
 
@@ -301,17 +905,29 @@ def _patch_close_event_for_drafts() -> None:
     def wrapped_close_event(self: AddCards, evt: QCloseEvent) -> None:
         # When the Add window is really closing (e.g. Discard confirmed),
         # this method is called. Crashes/power loss never call this.
+        #
+        # Newer Anki calls closeEvent first to ask "Discard current input?"
+        # and again, with _close_event_has_cleaned_up set, once the window
+        # really closes; only clear on that second call. Older Anki has no
+        # such flag, so clear on every call there.
+        if not getattr(self, "_close_event_has_cleaned_up", True):
+            original_close_event(self, evt)
+            return
+
         try:
             nt_name = getattr(self, "_draft_autosave_last_nt_name", "")
         except Exception:
             nt_name = ""
 
+        # On older Anki the "Discard current input?" prompt comes after
+        # this, so the dialog may stay open; rewrite the draft soon.
+        _forget_saved_payloads()
+
+        # Delete the draft on the thread pool so closing doesn't wait on
+        # disk I/O. A save still queued for this draft is dropped by the
+        # clear's generation bump.
         try:
-            if nt_name:
-                _clear_backup_for_notetype(nt_name)
-            else:
-                # As a fallback, clear all drafts
-                _clear_all_backups()
+            QThreadPool.globalInstance().start(_ClearRunnable(nt_name, _backup_dir()))
         except Exception:
             # Don't let errors here crash Anki
             pass
@@ -328,19 +944,54 @@ _patch_close_event_for_drafts()
 
 # ---- Hooks ---------------------------------------------------------------
 
+def on_profile_did_open() -> None:
+    """Called when a profile is loaded; prune its stale drafts once."""
+    try:
+        with _lock:
+            _prune_old_backups()
+    except Exception:
+        pass
+
+
 def on_add_cards_did_init(add_cards: AddCards) -> None:
     """Called when the Add Cards dialog is opened."""
     _restore_into_add_dialog(add_cards)
     _start_autosave_timer(add_cards)
 
 
+def on_editor_did_fire_typing_timer(note) -> None:
+    """Called shortly after the user stops typing in a field."""
+    _schedule_autosave(note)
+
+
+def on_editor_did_unfocus_field(changed: bool, note, current_field_idx: int) -> bool:
+    """Called when a field loses focus (filter hook; must return `changed`)."""
+    _schedule_autosave(note)
+    return changed
+
+
+def on_editor_did_update_tags(note) -> None:
+    """Called when the tags of the edited note change."""
+    _schedule_autosave(note)
+
+
 def on_add_cards_did_add_note(note) -> None:
     """Called when a note is successfully added from Add dialog."""
     # Once a card is actually added, we assume that draft is no longer needed
     nt_name = _note_type_name(note)
     if nt_name:
-        _clear_backup_for_notetype(nt_name)
+        # Like closing, delete on the thread pool so adding a note never
+        # waits for a save that is holding the file lock.
+        _forget_saved_payloads()
+        try:
+            QThreadPool.globalInstance().start(_ClearRunnable(nt_name, _backup_dir()))
+        except Exception:
+            pass
 
 
+profile_did_open.append(on_profile_did_open)
 add_cards_did_init.append(on_add_cards_did_init)
 add_cards_did_add_note.append(on_add_cards_did_add_note)
+editor_did_fire_typing_timer.append(on_editor_did_fire_typing_timer)
+editor_did_unfocus_field.append(on_editor_did_unfocus_field)
+editor_did_update_tags.append(on_editor_did_update_tags)